@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import ast
+import re
+import sys
 import typing as t
-from functools import lru_cache
 
 AST_FUNC_NODES_T: t.TypeAlias = ast.FunctionDef | ast.AsyncFunctionDef
 AST_DEF_NODES_T: t.TypeAlias = AST_FUNC_NODES_T | ast.ClassDef
 AST_ASSIGN_NODES_T: t.TypeAlias = ast.Assign | ast.AnnAssign | ast.AugAssign
 
+SPECIAL_DECORATORS = frozenset({"classmethod", "staticmethod"})
+
+# Builtin ASDL types, these never hold child nodes
+_ASDL_BUILTINS = frozenset({"identifier", "int", "string", "constant", "object", "singleton"})
+_ASDL_SIGNATURE = re.compile(r"^\w+\((.*)\)$")
+_STMT_LIST_KINDS = frozenset({"stmt", "excepthandler", "match_case"})
+# Fallback statement list field names, if field types can't be determined
+_STMT_LIST_NAMES = frozenset({"body", "orelse", "finalbody", "handlers", "cases"})
+_CHILD_FIELDS: dict[type, tuple[str, ...]] = {}
+_STMT_FIELDS: dict[type, tuple[str, ...]] = {}
+
 
 class ResolvedCallError(Exception): ...  # noqa: D101
 
@@ -18,16 +30,133 @@ class HasLoc(t.Protocol):  # noqa: D101
     col_offset: int
 
 
-def has_special_decorator(node: AST_FUNC_NODES_T) -> bool:
-    """Return `True` if the node is decorated with `@classmethod` or `@staticmethod`."""
-    for d in node.decorator_list:
-        if isinstance(d, ast.Name):
-            if d.id in {"classmethod", "staticmethod"}:
-                return True
+def _classify_annotation(annotation: t.Any) -> tuple[str | None, bool]:
+    """
+    Classify a `_field_types` annotation into a `(node kind, is list)` pair.
+
+    The node kind is the name of the AST class the field holds, or `None` if it doesn't hold nodes.
+    """
+    is_list = t.get_origin(annotation) is list
+    if is_list:
+        annotation = t.get_args(annotation)[0]
+
+    # Optional fields are annotated as a union with None
+    for candidate in t.get_args(annotation) or (annotation,):
+        if isinstance(candidate, type) and issubclass(candidate, ast.AST):
+            return candidate.__name__, is_list
+
+    return None, is_list
+
+
+def _asdl_fields(cls: type) -> list[tuple[str | None, bool, str]] | None:
+    """
+    Classify the fields of the provided AST class into `(node kind, is list, name)` triples.
+
+    The node kind is the name of the AST class the field holds, or `None` if it doesn't hold nodes.
+
+    Where available (Python 3.13+), fields are classified using the class's `_field_types`.
+    Otherwise, the ASDL signature that CPython provides as the docstring of each concrete node
+    class is parsed, e.g. `Assign(expr* targets, expr value, string? type_comment)`. If the fields
+    can't be classified, `None` is returned.
+    """
+    field_types = getattr(cls, "_field_types", None)
+    if field_types is not None:
+        try:
+            return [
+                (*_classify_annotation(field_types[name]), name)
+                for name in getattr(cls, "_fields", ())
+            ]
+        except (IndexError, KeyError, TypeError):
+            return None
+
+    signature = _ASDL_SIGNATURE.match((cls.__doc__ or "").split("\n", maxsplit=1)[0])
+    if signature is None:
+        return None
+
+    fields: list[tuple[str | None, bool, str]] = []
+    for field_spec in signature.group(1).split(","):
+        # The docstring format isn't documented, so bail on anything unexpected
+        parts = field_spec.split()
+        if len(parts) != 2:
+            return None
+
+        field_type, field_name = parts
+        kind = field_type.rstrip("*?")
+        fields.append((None if kind in _ASDL_BUILTINS else kind, field_type[-1] == "*", field_name))
+
+    return fields
+
+
+def _get_child_fields(cls: type) -> tuple[str, ...]:
+    """
+    Return the fields of the provided AST class that can contain child nodes or lists thereof.
+
+    If the class's fields can't be classified then we fall back to all of the class's fields.
+    """
+    fields = _CHILD_FIELDS.get(cls)
+    if fields is not None:
+        return fields
+
+    asdl_fields = _asdl_fields(cls)
+    if asdl_fields is None:
+        fields = tuple(getattr(cls, "_fields", ()))
+    else:
+        fields = tuple(name for kind, _, name in asdl_fields if kind is not None)
+
+    _CHILD_FIELDS[cls] = fields
+    return fields
+
+
+def _get_stmt_fields(cls: type) -> tuple[str, ...]:
+    """
+    Return the fields of the provided AST class that contain lists of statements.
+
+    Exception handlers & match cases are included since their bodies are statement lists.
+
+    If the class's fields can't be classified then we fall back to the class's fields whose names
+    are used for statement lists. These names are only used for statement lists by statement-like
+    nodes, which are the only nodes whose statement fields are walked.
+    """
+    fields = _STMT_FIELDS.get(cls)
+    if fields is not None:
+        return fields
+
+    asdl_fields = _asdl_fields(cls)
+    if asdl_fields is None:
+        fields = tuple(f for f in getattr(cls, "_fields", ()) if f in _STMT_LIST_NAMES)
+    else:
+        fields = tuple(
+            name for kind, is_list, name in asdl_fields if is_list and (kind in _STMT_LIST_KINDS)
+        )
+
+    _STMT_FIELDS[cls] = fields
+    return fields
+
+
+def contains_classdef(node: ast.AST) -> bool:
+    """
+    Return `True` if a class definition is nested anywhere within the provided node.
+
+    Since class definitions are always statements, only statement lists need to be searched.
+    """
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for field in _get_stmt_fields(type(current)):
+            for stmt in getattr(current, field):
+                if type(stmt) is ast.ClassDef:
+                    return True
+
+                stack.append(stmt)
 
     return False
 
 
+def has_special_decorator(node: AST_FUNC_NODES_T) -> bool:
+    """Return `True` if the node is decorated with `@classmethod` or `@staticmethod`."""
+    return any((type(d) is ast.Name) and (d.id in SPECIAL_DECORATORS) for d in node.decorator_list)
+
+
 class AssignSpec(t.NamedTuple):
     """
     Helper container for an assignment statement's leftmost components.
@@ -54,22 +183,25 @@ class SelfAssignNode(t.NamedTuple):
     end_lineno: int | None
     end_col_offset: int | None
 
-    @classmethod
-    def from_node(cls, attr: str, node: AST_ASSIGN_NODES_T) -> SelfAssignNode:
-        """
-        Build an `SelfAssignNode` instance from the provided assignment node.
 
-        NOTE: In cases where an assignment statement has multiple targets (e.g. `a,b = c`), location
-        information for the extracted assignment targets will all share that of the base assignment
-        node.
-        """
-        return cls(
-            attr=attr,
-            lineno=node.lineno,
-            col_offset=node.col_offset,
-            end_lineno=node.end_lineno,
-            end_col_offset=node.end_col_offset,
-        )
+def iter_self_assign_nodes(
+    node: AST_ASSIGN_NODES_T, specs: t.Iterable[AssignSpec], instance_varname: str
+) -> t.Iterator[SelfAssignNode]:
+    """
+    Yield a `SelfAssignNode` for each resolved component of the node assigned to the instance.
+
+    Components whose base is not the provided instance variable name (e.g. local variables) are
+    filtered out before any `SelfAssignNode` is built.
+
+    NOTE: In cases where an assignment statement has multiple targets (e.g. `a,b = c`), location
+    information for the extracted assignment targets will all share that of the base assignment
+    node.
+    """
+    lineno, col_offset = node.lineno, node.col_offset
+    end_lineno, end_col_offset = node.end_lineno, node.end_col_offset
+    for spec in specs:
+        if spec.base == instance_varname:
+            yield SelfAssignNode(spec.attr, lineno, col_offset, end_lineno, end_col_offset)
 
 
 def resolve_attribute(base_node: ast.Attribute) -> AssignSpec:
@@ -88,18 +220,23 @@ def resolve_attribute(base_node: ast.Attribute) -> AssignSpec:
     """
     # With nested attribute access, the leftmost components that we're interested in end up being
     # at the deepest part of the base node's value component, so we have to go spelunking
+    # AST leaf classes aren't subclassed, so we can get away with identity checks on the node type
+    attr = ""
     node: ast.AST = base_node
-    while isinstance(node, (ast.Attribute, ast.Subscript)):
-        if isinstance(node, ast.Attribute):
-            attr = node.attr
-            node = node.value
+    while True:
+        node_type = type(node)
+        if node_type is ast.Attribute:
+            attr = node.attr  # type: ignore[attr-defined]
+            node = node.value  # type: ignore[attr-defined]
+        elif node_type is ast.Subscript:
+            node = node.value  # type: ignore[attr-defined]
         else:
-            node = node.value
+            break
 
     # If we've gotten here, we should either have the base node in the simple case, or the leftmost
     # attribute access of a nested node
-    if isinstance(node, ast.Name):
-        return AssignSpec(node.id, attr)
+    if type(node) is ast.Name:
+        return AssignSpec(sys.intern(node.id), sys.intern(attr))
     elif isinstance(node, ast.Call):
         # Raise here so we can ignore function calls upstream, e.g. self.foo().bar = 5
         # Seems easiest to control via exception rather than monkeying with the resolver return
@@ -111,6 +248,43 @@ def resolve_attribute(base_node: ast.Attribute) -> AssignSpec:
         )
 
 
+def resolve_assign_specs(node: ast.AST) -> tuple[AssignSpec, ...]:
+    """
+    Resolve an assignment statement into its leftmost components, in source order.
+
+    Top level calls are expected to pass an instance of `ast.Assign`, `ast.AnnAssign`, or
+    `ast.AugAssign`.
+
+    Resolved names are interned so downstream comparisons against the instance variable name &
+    attribute sets can hit the string identity fast path. CPython's parser already interns
+    identifiers, but trees built or transformed by other tools may not.
+
+    NOTE: Components are not deduplicated, e.g. `self.a, self.a = 1, 2` will resolve to two
+    `AssignSpec("self", "a")` components.
+    """
+    # The vast majority of assignments have a single Name or Attribute target, so resolve these
+    # directly rather than going through the recursive resolvers
+    node_type = type(node)
+    if node_type is ast.Assign and len(node.targets) == 1:  # type: ignore[attr-defined]
+        target = node.targets[0]  # type: ignore[attr-defined]
+    elif node_type is ast.AnnAssign or node_type is ast.AugAssign:
+        target = node.target  # type: ignore[attr-defined]
+    else:
+        target = None
+
+    target_type = type(target)
+    if target_type is ast.Name:
+        assigned: tuple[AssignSpec, ...] = (AssignSpec(sys.intern(target.id), ""),)
+    elif target_type is ast.Attribute:
+        assigned = (resolve_attribute(target),)
+    else:
+        out: list[AssignSpec] = []
+        _resolve_assign(node, out)
+        assigned = tuple(out)
+
+    return assigned
+
+
 def resolve_assign(node: ast.AST) -> set[AssignSpec]:
     """
     Resolve an assignment statement into its lefmost components.
@@ -118,39 +292,74 @@ def resolve_assign(node: ast.AST) -> set[AssignSpec]:
     Top level calls are expected to pass an instance of `ast.Assign`, `ast.AnnAssign`, or
     `ast.AugAssign`.
     """
-    assigned = set()
-    match node:
-        case ast.Assign():
-            for n in node.targets:
-                assigned.update(resolve_assign(n))
-        case ast.AnnAssign() | ast.AugAssign():
-            assigned.update(resolve_assign(node.target))
-        case ast.Tuple() | ast.List():
-            for n in node.elts:
-                assigned.update(resolve_assign(n))
-        case ast.Attribute():
-            assigned.add(resolve_attribute(node))
-        case ast.Name():
-            assigned.add(AssignSpec(node.id, ""))
-        case ast.Subscript() | ast.Starred():
-            assigned.update(resolve_assign(node.value))
-        case _:
-            msg_base = f"Unexpected node type: {type(node)}"
-            if isinstance(node, HasLoc):
-                msg = f"{node.lineno}:{node.col_offset} {msg_base}"
-            else:
-                msg = msg_base
+    return set(resolve_assign_specs(node))
 
-            raise ValueError(msg)
 
-    return assigned
+def _resolve_targets(node: ast.Assign, out: list[AssignSpec]) -> None:
+    for n in node.targets:
+        _resolve_assign(n, out)
+
+
+def _resolve_target(node: ast.AnnAssign | ast.AugAssign, out: list[AssignSpec]) -> None:
+    _resolve_assign(node.target, out)
+
+
+def _resolve_elts(node: ast.Tuple | ast.List, out: list[AssignSpec]) -> None:
+    for n in node.elts:
+        _resolve_assign(n, out)
+
+
+def _resolve_value(node: ast.Subscript | ast.Starred, out: list[AssignSpec]) -> None:
+    _resolve_assign(node.value, out)
+
+
+def _resolve_attribute(node: ast.Attribute, out: list[AssignSpec]) -> None:
+    out.append(resolve_attribute(node))
+
+
+def _resolve_name(node: ast.Name, out: list[AssignSpec]) -> None:
+    out.append(AssignSpec(sys.intern(node.id), ""))
+
+
+# Dispatch on exact type rather than using match, whose class patterns compile to a chain of
+# isinstance checks
+_RESOLVERS: dict[type[ast.AST], t.Callable[[t.Any, list[AssignSpec]], None]] = {
+    ast.Assign: _resolve_targets,
+    ast.AnnAssign: _resolve_target,
+    ast.AugAssign: _resolve_target,
+    ast.Tuple: _resolve_elts,
+    ast.List: _resolve_elts,
+    ast.Attribute: _resolve_attribute,
+    ast.Name: _resolve_name,
+    ast.Subscript: _resolve_value,
+    ast.Starred: _resolve_value,
+}
+
+
+def _resolve_assign(node: ast.AST, out: list[AssignSpec]) -> None:
+    """
+    Recursively resolve an assignment statement into its leftmost components.
+
+    Resolved components are appended to the provided `out` accumulator, which may end up containing
+    duplicates.
+    """
+    resolver = _RESOLVERS.get(type(node))
+    if resolver is None:
+        msg_base = f"Unexpected node type: {type(node)}"
+        if isinstance(node, HasLoc):
+            msg = f"{node.lineno}:{node.col_offset} {msg_base}"
+        else:
+            msg = msg_base
+
+        raise ValueError(msg)
+
+    resolver(node, out)
 
 
-@lru_cache
 def resolve_instance_name(node: AST_FUNC_NODES_T) -> str:
     """Resolve the name of the instance variable of a class method, assumed to be the first var."""
-    # Probably a needless optimization, but use a function so we can cache since this is being
-    # called for each variable within a function's context
+    # This is cheap enough that caching isn't worth it, an lru_cache keyed on the node would also
+    # keep every method node alive for the lifetime of the process
     return node.args.args[0].arg
 
 
@@ -166,10 +375,16 @@ class FDCAVisitor(ast.NodeVisitor):
         * `init_vars` - Class attributes defined in `__init__` or `__post_init__`
         * `method_vars` - Class attributes defined in methods (`@classmethod` and `@staticmethod`
         are ignored)
+
+    NOTE: `method_vars` is not deduplicated, e.g. `self.a, self.a = 1, 2` in a method will yield two
+    identical `SelfAssignNode` instances.
     """
 
     _context: list[AST_DEF_NODES_T]
     _n_contained_classdef: int
+    _depth_from_classdef: list[int]
+    _dispatch: dict[type[ast.AST], t.Callable[[t.Any], None]]
+    _stack: list[tuple[ast.AST | None, bool]]
 
     class_vars: set[str]
     init_vars: set[str]
@@ -178,28 +393,88 @@ class FDCAVisitor(ast.NodeVisitor):
     def __init__(self) -> None:
         self._context = []
         self._n_contained_classdef = 0
+        self._depth_from_classdef = []
+        self._stack = []
 
         self.class_vars = set()
         self.init_vars = set()
         self.method_vars = []
 
-    @property
-    def _n_function_levels(self) -> int:
+        # Precompute the node type -> handler mapping so we can skip the name formatting & getattr
+        # that ast.NodeVisitor.visit does for every node. AST leaf classes aren't subclassed, so we
+        # can dispatch on exact type
+        self._dispatch = {
+            ast.FunctionDef: self.switch_context,
+            ast.AsyncFunctionDef: self.switch_context,
+            ast.ClassDef: self.switch_context,
+            ast.Assign: self.visit_assign,
+            ast.AnnAssign: self.visit_assign,
+            ast.AugAssign: self.visit_assign,
+        }
+
+    def visit(self, node: ast.AST) -> None:
         """
-        Depth of current context from the most recent `ClassDef`.
+        Walk the tree rooted at the provided node.
 
-        Returns `None` if no `ClassDef` is contained in context
+        Rather than recursing through `ast.NodeVisitor.visit`, the walk is driven iteratively from
+        an explicit stack of `(node, statements_only)` pairs. Handlers & `generic_visit` schedule
+        child nodes by pushing them onto the stack, and a `None` node is pushed as a sentinel to
+        mark where a class or function's context should be exited.
         """
-        depth = 0
-        for node in reversed(self._context):
-            if isinstance(node, ast.ClassDef):
-                return depth
+        self._stack = [(node, False)]
+        stack = self._stack
+        dispatch = self._dispatch
+        while stack:
+            current, statements_only = stack.pop()
+            if current is None:
+                self.exit_context()
+                continue
+
+            handler = dispatch.get(type(current))
+            if handler is not None:
+                handler(current)
+            elif statements_only:
+                self.visit_statements(current)
+            else:
+                self.generic_visit(current)
 
-            depth += 1
+    def generic_visit(self, node: ast.AST) -> None:
+        """
+        Schedule the children of the provided node to be visited.
 
-        # Included for completeness. This should already guarded upstream & is only called if the
-        # context tree contains at least one ClassDef node
-        raise RuntimeError("Attempted to find depth from ClassDef with none in context")
+        Unlike `ast.NodeVisitor.generic_visit`, only fields that can contain child nodes are
+        visited, as precomputed per AST class by `_get_child_fields`.
+        """
+        children: list[tuple[ast.AST | None, bool]] = []
+        for field in _get_child_fields(type(node)):
+            value = getattr(node, field, None)
+            if value is None:
+                continue
+
+            if type(value) is list:
+                for item in value:
+                    # Lists may contain None, e.g. the keys of a dict literal using ** unpacking
+                    if item is not None:
+                        children.append((item, False))
+            else:
+                children.append((value, False))
+
+        # Push in reverse so children are popped in source order
+        self._stack.extend(reversed(children))
+
+    def visit_statements(self, node: ast.AST) -> None:
+        """
+        Schedule only the statements nested within the provided node to be visited.
+
+        Since assignments & class definitions are always statements, expression subtrees (e.g.
+        default values, decorators, comprehensions, call arguments) can't contain anything of
+        interest and are skipped entirely.
+        """
+        children: list[tuple[ast.AST | None, bool]] = []
+        for field in _get_stmt_fields(type(node)):
+            children.extend((stmt, True) for stmt in getattr(node, field))
+
+        self._stack.extend(reversed(children))
 
     def switch_context(self, node: AST_DEF_NODES_T) -> None:
         """Keep track of class & function context to assist with dispatching walk behavior."""
@@ -212,10 +487,32 @@ class FDCAVisitor(ast.NodeVisitor):
                 # Skip classmethod & staticmethod
                 return
 
+        # Track the depth of each context from its most recent ClassDef alongside the context itself
+        # so it doesn't need to be rederived for every assignment
+        if is_classdef:
+            depth = 0
+        elif self._depth_from_classdef:
+            depth = self._depth_from_classdef[-1] + 1
+        else:
+            depth = 0  # Not within a class, this won't be used downstream
+
         self._context.append(node)
-        self.generic_visit(node)
-        popped = self._context.pop()
+        self._depth_from_classdef.append(depth)
+        self._stack.append((None, False))  # Exit this context once all children have been visited
+        if is_classdef:
+            # Only the class body can contribute attributes, its bases, keywords, & decorators are
+            # pure expression trees so there's no need to walk them
+            self._stack.extend((stmt, False) for stmt in reversed(node.body))
+        elif self._n_contained_classdef == 0:
+            self.generic_visit(node)
+        else:
+            # Inside of a class, function bodies only need to be walked statement-wise
+            self.visit_statements(node)
 
+    def exit_context(self) -> None:
+        """Exit the most recently entered class or function context."""
+        popped = self._context.pop()
+        self._depth_from_classdef.pop()
         if isinstance(popped, ast.ClassDef):
             self._n_contained_classdef -= 1
 
@@ -236,7 +533,7 @@ class FDCAVisitor(ast.NodeVisitor):
         # Skip instances where the resolved assignment utilizes a function call, e.g.
         # self.foo().bar = 5
         try:
-            new_nodes = resolve_assign(node)
+            new_nodes = resolve_assign_specs(node)
         except ResolvedCallError:
             return
 
@@ -248,24 +545,14 @@ class FDCAVisitor(ast.NodeVisitor):
             # hopefully end up being the function that accepts the instance variable.
             # This isn't perfect, e.g. things might go badly if the nested function accepts the
             # instance under a new name, but I think it should do well for most projects?
-            method_level = self._context[-self._n_function_levels]
+            method_level = self._context[-self._depth_from_classdef[-1]]
 
-            instance_varname = resolve_instance_name(method_level)
-            self_nodes = (n for n in new_nodes if n.base == instance_varname)
+            # Depth is at least 1 here, so this is always a function node
+            instance_varname = resolve_instance_name(method_level)  # type: ignore[arg-type]
 
             method_name = method_level.name
             if method_name in {"__init__", "__post_init__"}:
-                self.init_vars.update(s.attr for s in self_nodes)
+                self.init_vars.update(s.attr for s in new_nodes if s.base == instance_varname)
             else:
                 # Retain node location information for methods so we can emit errors downstream
-                self.method_vars.extend(
-                    (SelfAssignNode.from_node(s.attr, node) for s in self_nodes)
-                )
-
-    visit_FunctionDef = switch_context
-    visit_AsyncFunctionDef = switch_context
-    visit_ClassDef = switch_context
-
-    visit_Assign = visit_assign
-    visit_AnnAssign = visit_assign
-    visit_AugAssign = visit_assign
+                self.method_vars.extend(iter_self_assign_nodes(node, new_nodes, instance_varname))
@@ -2,7 +2,11 @@ import ast
 import typing as t
 
 from flake8_define_class_attributes import __version__
-from flake8_define_class_attributes.ast_walker import FDCAVisitor, SelfAssignNode
+from flake8_define_class_attributes.ast_walker import (
+    FDCAVisitor,
+    SelfAssignNode,
+    contains_classdef,
+)
 
 FORMATTED_ERROR: t.TypeAlias = tuple[int, int, str, t.Type[t.Any]]
 
@@ -33,14 +37,23 @@ class ClassAttributeChecker:  # noqa: D101
         This should yield tuples with the following information:
             (line number, column number, message, checker type)
         """
-        if self.tree is not None:
-            visitor = FDCAVisitor()
-            visitor.visit(self.tree)
-        else:
+        # Many modules don't define any classes, so we can skip the full walk entirely
+        if (self.tree is None) or (not contains_classdef(self.tree)):
             return
 
+        visitor = FDCAVisitor()
+        visitor.visit(self.tree)
+
+        # Attributes are tracked by name, so merge the defined sets once & probe a single set
+        defined_attrs = visitor.init_vars | visitor.class_vars
+
+        # Method attributes are collected without deduplication, so dedupe once here to avoid
+        # reporting the same assignment more than once (e.g. self.a, self.a = 1, 2)
+        seen = set()
         for a in visitor.method_vars:
-            if (a.attr in visitor.init_vars) or (a.attr in visitor.class_vars):
+            if (a.attr in defined_attrs) or (a in seen):
                 continue
 
+            seen.add(a)
+
             yield CLA001(a).to_flake8()
@@ -0,0 +1,10 @@
+import ast
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _parse(src: str) -> ast.Module:
+    # Many test sources are shared across modules, so only parse each unique source once. Neither
+    # the walker nor the checker write anything onto the tree's nodes, so it's safe to share parsed
+    # trees between tests
+    return ast.parse(src)
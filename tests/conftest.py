@@ -0,0 +1,16 @@
+import ast
+
+import pytest
+
+from tests import _parse
+
+
+@pytest.fixture(scope="session")
+def tree(request: pytest.FixtureRequest) -> ast.Module:
+    """
+    Parse the source string indirectly parametrized as `tree`.
+
+    Session scoping, along with the `_parse` cache, parses each unique source once per session
+    while keeping the source string as the test ID.
+    """
+    return _parse(request.param)
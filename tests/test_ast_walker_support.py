@@ -5,11 +5,102 @@ import pytest
 from flake8_define_class_attributes.ast_walker import (
     AssignSpec,
     ResolvedCallError,
+    SelfAssignNode,
+    _get_child_fields,
+    _get_stmt_fields,
+    contains_classdef,
     has_special_decorator,
+    iter_self_assign_nodes,
     resolve_assign,
+    resolve_assign_specs,
     resolve_attribute,
     resolve_instance_name,
 )
+from tests import _parse
+
+CHILD_FIELD_TEST_CASES = (
+    (ast.Assign, ("targets", "value")),
+    (ast.Attribute, ("value", "ctx")),
+    (ast.If, ("test", "body", "orelse")),
+    (ast.Constant, ()),
+    (ast.Load, ()),
+    (ast.Name, ("ctx",)),
+)
+
+
+@pytest.mark.parametrize(("cls", "truth_out"), CHILD_FIELD_TEST_CASES)
+def test_get_child_fields(cls: type, truth_out: tuple[str, ...]) -> None:
+    assert _get_child_fields(cls) == truth_out
+
+
+STMT_FIELD_TEST_CASES = (
+    (ast.Assign, ()),
+    (ast.If, ("body", "orelse")),
+    (ast.Try, ("body", "handlers", "orelse", "finalbody")),
+    (ast.ExceptHandler, ("body",)),
+    (ast.Match, ("cases",)),
+    (ast.Lambda, ()),
+)
+
+
+@pytest.mark.parametrize(("cls", "truth_out"), STMT_FIELD_TEST_CASES)
+def test_get_stmt_fields(cls: type, truth_out: tuple[str, ...]) -> None:
+    assert _get_stmt_fields(cls) == truth_out
+
+
+class FieldTypesNode(ast.AST):
+    # Mimic the field annotations provided by Python 3.13+
+    _fields = ("body", "handlers", "value", "keys", "name")
+    _field_types = {
+        "body": list[ast.stmt],
+        "handlers": list[ast.excepthandler],
+        "value": ast.expr | None,
+        "keys": list[ast.expr | None],
+        "name": str,
+    }
+
+
+class MalformedSignatureNode(ast.AST):
+    __doc__ = "MalformedSignatureNode(expr* targets, stmt* body, expr)"
+    _fields = ("targets", "body", "value")
+
+
+class MalformedFieldTypesNode(ast.AST):
+    _fields = ("body", "value")
+    _field_types = {"body": list[ast.stmt]}  # Missing value
+
+
+FIELD_CLASSIFICATION_TEST_CASES = (
+    (FieldTypesNode, ("body", "handlers", "value", "keys"), ("body", "handlers")),
+    (MalformedSignatureNode, ("targets", "body", "value"), ("body",)),
+    (MalformedFieldTypesNode, ("body", "value"), ("body",)),
+)
+
+
+@pytest.mark.parametrize(
+    ("cls", "truth_child_fields", "truth_stmt_fields"), FIELD_CLASSIFICATION_TEST_CASES
+)
+def test_field_classification(
+    cls: type, truth_child_fields: tuple[str, ...], truth_stmt_fields: tuple[str, ...]
+) -> None:
+    assert _get_child_fields(cls) == truth_child_fields
+    assert _get_stmt_fields(cls) == truth_stmt_fields
+
+
+CONTAINS_CLASSDEF_TEST_CASES = (
+    ("a = 5", False),
+    ("def foo():\n\tx = lambda: 5", False),
+    ("class Foo: ...", True),
+    ("if True:\n\tclass Foo: ...", True),
+    ("try:\n\t...\nexcept ValueError:\n\tclass Foo: ...", True),
+    ("def foo():\n\tfor _ in range(3):\n\t\tclass Foo: ...", True),
+)
+
+
+@pytest.mark.parametrize(("tree", "truth_out"), CONTAINS_CLASSDEF_TEST_CASES, indirect=["tree"])
+def test_contains_classdef(tree: ast.Module, truth_out: bool) -> None:
+    assert contains_classdef(tree) == truth_out
+
 
 DECORATOR_TEST_CASES = (
     ("@classmethod\ndef foo(self): ...", True),
@@ -23,9 +114,8 @@ DECORATOR_TEST_CASES = (
 )
 
 
-@pytest.mark.parametrize(("src", "truth_out"), DECORATOR_TEST_CASES)
-def test_has_special_decorator(src: str, truth_out: bool) -> None:
-    tree = ast.parse(src)
+@pytest.mark.parametrize(("tree", "truth_out"), DECORATOR_TEST_CASES, indirect=["tree"])
+def test_has_special_decorator(tree: ast.Module, truth_out: bool) -> None:
     function_node = tree.body[0]
 
     assert has_special_decorator(function_node) == truth_out  # type: ignore[arg-type]
@@ -40,9 +130,8 @@ ATTRIBUTE_TEST_CASES = (
 )
 
 
-@pytest.mark.parametrize(("src", "truth_out"), ATTRIBUTE_TEST_CASES)
-def test_resolve_attribute(src: str, truth_out: AssignSpec) -> None:
-    tree = ast.parse(src)
+@pytest.mark.parametrize(("tree", "truth_out"), ATTRIBUTE_TEST_CASES, indirect=["tree"])
+def test_resolve_attribute(tree: ast.Module, truth_out: AssignSpec) -> None:
     assignment_target = tree.body[0].targets[0]  # type: ignore[attr-defined]
 
     assert resolve_attribute(assignment_target) == truth_out
@@ -66,32 +155,61 @@ ASSIGN_TEST_CASES = (
 )
 
 
-@pytest.mark.parametrize(("src", "truth_out"), ASSIGN_TEST_CASES)
-def test_resolve_assign(src: str, truth_out: set[AssignSpec]) -> None:
-    tree = ast.parse(src)
+@pytest.mark.parametrize(("tree", "truth_out"), ASSIGN_TEST_CASES, indirect=["tree"])
+def test_resolve_assign(tree: ast.Module, truth_out: set[AssignSpec]) -> None:
     node = tree.body[0]
 
     assert resolve_assign(node) == truth_out
 
 
+def test_resolve_assign_specs() -> None:
+    tree = _parse("self.b, a, self.b = 42, 13, 7")
+    node = tree.body[0]
+
+    # Components should be in source order & not deduplicated
+    assert resolve_assign_specs(node) == (
+        AssignSpec("self", "b"),
+        AssignSpec("a", ""),
+        AssignSpec("self", "b"),
+    )
+
+
 INSTANCE_VAR_TEST_CASES = (
     ("class Foo:\n\tdef __init__(self): ...", "self"),
     ("class Foo:\n\tdef __init__(slef): ...", "slef"),
 )
 
 
-@pytest.mark.parametrize(("src", "truth_out"), INSTANCE_VAR_TEST_CASES)
-def test_resolve_instance_name(src: str, truth_out: str) -> None:
-    tree = ast.parse(src)
+@pytest.mark.parametrize(("tree", "truth_out"), INSTANCE_VAR_TEST_CASES, indirect=["tree"])
+def test_resolve_instance_name(tree: ast.Module, truth_out: str) -> None:
     node = tree.body[0].body[0]  # type: ignore[attr-defined]
 
     assert resolve_instance_name(node) == truth_out
 
 
+def test_iter_self_assign_nodes() -> None:
+    tree = _parse("self.a, b, slef.c = 42, 13, 7")
+    node = tree.body[0]
+    specs = (AssignSpec("self", "a"), AssignSpec("b", ""), AssignSpec("slef", "c"))
+
+    assert list(iter_self_assign_nodes(node, specs, "self")) == [  # type: ignore[arg-type]
+        SelfAssignNode(attr="a", lineno=1, col_offset=0, end_lineno=1, end_col_offset=29)
+    ]
+
+
 def test_assign_with_call_raises() -> None:
     SRC = "class Foo:\n\tdef foo(self):\n\t\tself.foo().bar = 5"
-    tree = ast.parse(SRC)
+    tree = _parse(SRC)
     node = tree.body[0].body[0].body[0]  # type: ignore[attr-defined]
 
     with pytest.raises(ResolvedCallError):
         resolve_assign(node.targets[0])
+
+
+def test_assign_with_unexpected_node_raises() -> None:
+    SRC = "42"
+    tree = _parse(SRC)
+    node = tree.body[0].value  # type: ignore[attr-defined]
+
+    with pytest.raises(ValueError, match="Unexpected node type"):
+        resolve_assign(node)
@@ -5,6 +5,7 @@ import pytest
 
 from flake8_define_class_attributes.ast_walker import SelfAssignNode
 from flake8_define_class_attributes.checker import CLA001, ClassAttributeChecker, FORMATTED_ERROR
+from tests import _parse
 
 
 def test_err_to_flake8() -> None:
@@ -23,7 +24,7 @@ def test_err_to_flake8() -> None:
 
 class SourceCheckCase(t.NamedTuple):
     src: str
-    truth_errors: set[FORMATTED_ERROR]  # May not be in order
+    truth_errors: frozenset[FORMATTED_ERROR]  # May not be in order
 
 
 # These should not yield errors
@@ -31,7 +32,7 @@ EMPTY_CLASS = SourceCheckCase(
     src="""\
 class Foo: ...
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_CLASSVAR = SourceCheckCase(
@@ -39,7 +40,7 @@ CLASS_WITH_CLASSVAR = SourceCheckCase(
 class Foo:
     a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_INITVAR = SourceCheckCase(
@@ -48,7 +49,7 @@ class Foo:
     def __init__(self):
         self.a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_CLASSMETHOD = SourceCheckCase(
@@ -58,7 +59,7 @@ class Foo:
     def beans(self):
         self.a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_STATICMETHOD = SourceCheckCase(
@@ -68,7 +69,7 @@ class Foo:
     def beans(self):
         self.a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 SIMPLE_DATACLASS = SourceCheckCase(
@@ -79,7 +80,7 @@ from dataclasses import dataclass
 class Foo:
     a: int = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 DATACLASS_WITH_POST_INIT = SourceCheckCase(
@@ -93,7 +94,7 @@ class Foo:
     def __post_init__(self):
         self.b = a
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_DEFINED_METHODVAR_AS_CLASSVAR = SourceCheckCase(
@@ -104,7 +105,7 @@ class Foo:
     def beans(self):
         self.a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_DEFINED_METHODVAR_AS_INITVAR = SourceCheckCase(
@@ -116,7 +117,7 @@ class Foo:
     def beans(self):
         self.a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_METHOD_NON_SELF_ATTR = SourceCheckCase(
@@ -125,7 +126,7 @@ class Foo:
     def beans(self):
         abcd.a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 SNEAKY_DEF_NOT_IN_CLASS = SourceCheckCase(
@@ -133,7 +134,7 @@ SNEAKY_DEF_NOT_IN_CLASS = SourceCheckCase(
 def beans(self):
     self.a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_MIXED_INSTANCE_VARNAME = SourceCheckCase(
@@ -145,7 +146,7 @@ class Foo:
     def beans(slef):
         slef.a = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_NESTED_DEFINED_VAR = SourceCheckCase(
@@ -157,7 +158,7 @@ class Foo:
         def deep_beans():
             self.a = 1
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 CLASS_WITH_CALL_IN_ASSIGN = SourceCheckCase(
@@ -166,7 +167,7 @@ class Foo:
     def beans(self):
         self.foo().bar = 5
 """,
-    truth_errors=set(),
+    truth_errors=frozenset(),
 )
 
 # These should yield errors
@@ -176,11 +177,15 @@ class Foo:
     def beans(self):
         self.a = 5
 """,
-    truth_errors={
-        CLA001(
-            SelfAssignNode(attr="a", lineno=3, col_offset=8, end_lineno=None, end_col_offset=None)
-        ).to_flake8()
-    },
+    truth_errors=frozenset(
+        {
+            CLA001(
+                SelfAssignNode(
+                    attr="a", lineno=3, col_offset=8, end_lineno=None, end_col_offset=None
+                )
+            ).to_flake8()
+        }
+    ),
 )
 
 CLASS_WITH_MULTI_UNDEFINED_VAR = SourceCheckCase(
@@ -197,14 +202,20 @@ class Foo:
         self.e = 5
         self.f = 6
 """,
-    truth_errors={
-        CLA001(
-            SelfAssignNode(attr="e", lineno=10, col_offset=8, end_lineno=None, end_col_offset=None)
-        ).to_flake8(),
-        CLA001(
-            SelfAssignNode(attr="f", lineno=11, col_offset=8, end_lineno=None, end_col_offset=None)
-        ).to_flake8(),
-    },
+    truth_errors=frozenset(
+        {
+            CLA001(
+                SelfAssignNode(
+                    attr="e", lineno=10, col_offset=8, end_lineno=None, end_col_offset=None
+                )
+            ).to_flake8(),
+            CLA001(
+                SelfAssignNode(
+                    attr="f", lineno=11, col_offset=8, end_lineno=None, end_col_offset=None
+                )
+            ).to_flake8(),
+        }
+    ),
 )
 
 CLASS_WITH_NESTED_UNDEFINED_VAR = SourceCheckCase(
@@ -214,11 +225,33 @@ class Foo:
         def deep_beans():
             self.a = 1
 """,
-    truth_errors={
-        CLA001(
-            SelfAssignNode(attr="a", lineno=4, col_offset=12, end_lineno=None, end_col_offset=None)
-        ).to_flake8(),
-    },
+    truth_errors=frozenset(
+        {
+            CLA001(
+                SelfAssignNode(
+                    attr="a", lineno=4, col_offset=12, end_lineno=None, end_col_offset=None
+                )
+            ).to_flake8(),
+        }
+    ),
+)
+
+CLASS_IN_FUNCTION_WITH_UNDEFINED_VAR = SourceCheckCase(
+    src="""\
+def make_foo():
+    class Foo:
+        def beans(self):
+            self.a = 5
+""",
+    truth_errors=frozenset(
+        {
+            CLA001(
+                SelfAssignNode(
+                    attr="a", lineno=4, col_offset=12, end_lineno=None, end_col_offset=None
+                )
+            ).to_flake8(),
+        }
+    ),
 )
 
 
@@ -242,13 +275,28 @@ SRC_CHECK_CASES = (
     CLASS_WITH_UNDEFINED_VAR,
     CLASS_WITH_MULTI_UNDEFINED_VAR,
     CLASS_WITH_NESTED_UNDEFINED_VAR,
+    CLASS_IN_FUNCTION_WITH_UNDEFINED_VAR,
 )
 
 
-@pytest.mark.parametrize(("src", "truth_errors"), SRC_CHECK_CASES)
-def test_src_check(src: str, truth_errors: set[FORMATTED_ERROR]) -> None:
-    tree = ast.parse(src)
+@pytest.mark.xdist_group(name="check")
+@pytest.mark.parametrize(("tree", "truth_errors"), SRC_CHECK_CASES, indirect=["tree"])
+def test_src_check(tree: ast.Module, truth_errors: frozenset[FORMATTED_ERROR]) -> None:
+    checker = ClassAttributeChecker(tree)
+
+    if not truth_errors:
+        # Any yielded error is a failure, so there's no need to exhaust the generator
+        assert next(checker.run(), None) is None
+    else:
+        errs = frozenset(checker.run())
+        assert errs == truth_errors  # Errors may not be yielded in order
+
+
+def test_repeated_assign_target_reported_once() -> None:
+    SRC = "class Foo:\n\tdef beans(self):\n\t\tself.a, self.a = 5, 6"
+    tree = _parse(SRC)
     checker = ClassAttributeChecker(tree)
 
-    errs = set(checker.run())
-    assert errs == truth_errors  # Might have to use an order-agnostic comparison here
+    # Can't compare as a set here, otherwise duplicates would be hidden
+    errs = list(checker.run())
+    assert len(errs) == 1
@@ -8,8 +8,8 @@ from flake8_define_class_attributes.ast_walker import FDCAVisitor, SelfAssignNod
 
 class SourceWalkCase(t.NamedTuple):
     src: str
-    truth_class_vars: set[str]
-    truth_init_vars: set[str]
+    truth_class_vars: frozenset[str]
+    truth_init_vars: frozenset[str]
     truth_method_vars: list[SelfAssignNode]
 
 
@@ -17,8 +17,8 @@ EMPTY_CLASS = SourceWalkCase(
     src="""\
 class Foo: ...
 """,
-    truth_class_vars=set(),
-    truth_init_vars=set(),
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
     truth_method_vars=[],
 )
 
@@ -27,8 +27,8 @@ CLASS_WITH_CLASSVAR = SourceWalkCase(
 class Foo:
     a = 5
 """,
-    truth_class_vars={"a"},
-    truth_init_vars=set(),
+    truth_class_vars=frozenset({"a"}),
+    truth_init_vars=frozenset(),
     truth_method_vars=[],
 )
 
@@ -38,8 +38,8 @@ class Foo:
     def __init__(self):
         self.a = 5
 """,
-    truth_class_vars=set(),
-    truth_init_vars={"a"},
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset({"a"}),
     truth_method_vars=[],
 )
 
@@ -50,8 +50,8 @@ class Foo:
     def beans(self):
         self.a = 5
 """,
-    truth_class_vars=set(),
-    truth_init_vars=set(),
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
     truth_method_vars=[
         SelfAssignNode(attr="a", lineno=3, col_offset=8, end_lineno=3, end_col_offset=18)
     ],
@@ -63,8 +63,8 @@ class Foo:
     def beans(self):
         abcd.a = 5
 """,
-    truth_class_vars=set(),
-    truth_init_vars=set(),
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
     truth_method_vars=[],
 )
 
@@ -75,8 +75,8 @@ class Foo:
     def beans(self):
         self.a = 5
 """,
-    truth_class_vars=set(),
-    truth_init_vars=set(),
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
     truth_method_vars=[],
 )
 
@@ -87,8 +87,8 @@ class Foo:
     def beans(self):
         self.a = 5
 """,
-    truth_class_vars=set(),
-    truth_init_vars=set(),
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
     truth_method_vars=[],
 )
 
@@ -104,8 +104,8 @@ class Foo:
     def beans(self):
         self.c = 5
 """,
-    truth_class_vars={"a"},
-    truth_init_vars={"b"},
+    truth_class_vars=frozenset({"a"}),
+    truth_init_vars=frozenset({"b"}),
     truth_method_vars=[
         SelfAssignNode(attr="c", lineno=8, col_offset=8, end_lineno=8, end_col_offset=18)
     ],
@@ -125,14 +125,73 @@ class Foo:
         self.e = 5
         self.f = 6
 """,
-    truth_class_vars={"a", "b"},
-    truth_init_vars={"c", "d"},
+    truth_class_vars=frozenset({"a", "b"}),
+    truth_init_vars=frozenset({"c", "d"}),
     truth_method_vars=[
         SelfAssignNode(attr="e", lineno=10, col_offset=8, end_lineno=10, end_col_offset=18),
         SelfAssignNode(attr="f", lineno=11, col_offset=8, end_lineno=11, end_col_offset=18),
     ],
 )
 
+CLASS_WITH_BLOCK_NESTED_METHODVAR = SourceWalkCase(
+    src="""\
+class Foo:
+    def beans(self, a=[b for b in range(3)]):
+        if a:
+            for _ in a:
+                self.a = 5
+        try:
+            ...
+        except ValueError:
+            self.b = 5
+""",
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
+    truth_method_vars=[
+        SelfAssignNode(attr="a", lineno=5, col_offset=16, end_lineno=5, end_col_offset=26),
+        SelfAssignNode(attr="b", lineno=9, col_offset=12, end_lineno=9, end_col_offset=22),
+    ],
+)
+
+CLASS_WITH_CLASS_NESTED_IN_METHOD = SourceWalkCase(
+    src="""\
+class Foo:
+    def beans(self):
+        class Bar:
+            a = 5
+
+            def __init__(self):
+                self.b = 5
+""",
+    truth_class_vars=frozenset({"a"}),
+    truth_init_vars=frozenset({"b"}),
+    truth_method_vars=[],
+)
+
+CLASS_WITH_REPEATED_METHODVAR = SourceWalkCase(
+    src="""\
+class Foo:
+    def beans(self):
+        self.a, self.a = 5, 6
+""",
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
+    truth_method_vars=[
+        SelfAssignNode(attr="a", lineno=3, col_offset=8, end_lineno=3, end_col_offset=29),
+        SelfAssignNode(attr="a", lineno=3, col_offset=8, end_lineno=3, end_col_offset=29),
+    ],
+)
+
+CLASS_WITH_DICT_UNPACKING = SourceWalkCase(
+    src="""\
+class Foo:
+    {**a}
+""",
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
+    truth_method_vars=[],
+)
+
 
 SIMPLE_DATACLASS = SourceWalkCase(
     src="""\
@@ -142,8 +201,8 @@ from dataclasses import dataclass
 class Foo:
     a: int = 5
 """,
-    truth_class_vars={"a"},
-    truth_init_vars=set(),
+    truth_class_vars=frozenset({"a"}),
+    truth_init_vars=frozenset(),
     truth_method_vars=[],
 )
 
@@ -158,8 +217,8 @@ class Foo:
     def __post_init__(self):
         self.b = a
 """,
-    truth_class_vars={"a"},
-    truth_init_vars={"b"},
+    truth_class_vars=frozenset({"a"}),
+    truth_init_vars=frozenset({"b"}),
     truth_method_vars=[],
 )
 
@@ -168,8 +227,8 @@ SNEAKY_DEF_NOT_IN_CLASS = SourceWalkCase(
 def beans(self):
     self.a = 5
 """,
-    truth_class_vars=set(),
-    truth_init_vars=set(),
+    truth_class_vars=frozenset(),
+    truth_init_vars=frozenset(),
     truth_method_vars=[],
 )
 
@@ -184,22 +243,28 @@ SRC_WALK_TEST_CASES = (
     CLASS_WITH_STATICMETHOD,
     CLASS_WITH_ALL_VAR,
     CLASS_WITH_ALL_VAR_MULTI,
+    CLASS_WITH_BLOCK_NESTED_METHODVAR,
+    CLASS_WITH_CLASS_NESTED_IN_METHOD,
+    CLASS_WITH_REPEATED_METHODVAR,
+    CLASS_WITH_DICT_UNPACKING,
     SIMPLE_DATACLASS,
     DATACLASS_WITH_POST_INIT,
     SNEAKY_DEF_NOT_IN_CLASS,
 )
 
 
+@pytest.mark.xdist_group(name="walk")
 @pytest.mark.parametrize(
-    ("src", "truth_class_vars", "truth_init_vars", "truth_method_vars"), SRC_WALK_TEST_CASES
+    ("tree", "truth_class_vars", "truth_init_vars", "truth_method_vars"),
+    SRC_WALK_TEST_CASES,
+    indirect=["tree"],
 )
 def test_src_walk(
-    src: str,
-    truth_class_vars: set[str],
-    truth_init_vars: set[str],
+    tree: ast.Module,
+    truth_class_vars: frozenset[str],
+    truth_init_vars: frozenset[str],
     truth_method_vars: list[SelfAssignNode],
 ) -> None:
-    tree = ast.parse(src)
     visitor = FDCAVisitor()
     visitor.visit(tree)
 